@@ -0,0 +1,82 @@
+import numpy as np
+from dataclasses import dataclass
+
+from outcomes import *
+
+# Turn count reported for battles that would never end (neither side deals damage).
+STALEMATE_TURNS = -1
+
+# Sentinel hit count for a side that can never be defeated.
+_NEVER = np.iinfo(np.int64).max
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of a batch of battles resolved by battle_batch.
+
+    Attributes:
+        winners (np.ndarray): One winner code per battle (HERO_WINS, ENEMY_WINS or DRAW).
+        turns (np.ndarray): Number of turns each battle lasted, or STALEMATE_TURNS if it never ends.
+    """
+    winners: np.ndarray
+    turns: np.ndarray
+
+
+def _turns_to_defeat(health_points: np.ndarray, attack_damage: np.ndarray) -> np.ndarray:
+    """
+    Computes how many hits of attack_damage are needed to bring health_points to zero or below.
+
+    Args:
+        health_points (np.ndarray): Health of the defending side.
+        attack_damage (np.ndarray): Damage dealt per turn by the attacking side.
+
+    Returns:
+        np.ndarray: Hits needed per battle; 0 if already defeated, _NEVER if it never happens.
+    """
+    hits = np.full(health_points.shape, _NEVER, dtype=np.int64)
+    hurts = attack_damage > 0
+    # Ceiling division on positive damage: -(-hp // dmg).
+    np.negative(-health_points // np.where(hurts, attack_damage, 1), out=hits, where=hurts)
+    hits[health_points <= 0] = 0
+    return hits
+
+
+def battle_batch(hero_health, hero_attack, weapon_bonus, enemy_health, enemy_attack) -> BatchResult:
+    """
+    Resolves many battles at once using the same rules as battle() in main.py.
+
+    Each turn the enemy attacks first and then the hero strikes back, even if the enemy's
+    hit already dropped the hero to zero. The fight ends once either side's health is zero
+    or below. Instead of looping turn by turn, the number of turns each side survives is
+    computed in closed form, so every battle is resolved with a handful of array operations.
+
+    All arguments are broadcast against each other, so scalars can be mixed with arrays.
+    If every argument is a scalar, the result holds a single battle in length-1 arrays.
+
+    Args:
+        hero_health (array-like): Starting health_points of each hero.
+        hero_attack (array-like): Base attack_damage of each hero.
+        weapon_bonus (array-like): attack_increase of the equipped Weapon (0 if none).
+        enemy_health (array-like): Starting health_points of each enemy.
+        enemy_attack (array-like): attack_damage of each enemy.
+
+    Returns:
+        BatchResult: Winner codes and turn counts for every battle.
+    """
+    hero_health, hero_attack, weapon_bonus, enemy_health, enemy_attack = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(values, dtype=np.int64)) for values in
+          (hero_health, hero_attack, weapon_bonus, enemy_health, enemy_attack))
+    )
+    hero_survives = _turns_to_defeat(hero_health, enemy_attack)
+    enemy_survives = _turns_to_defeat(enemy_health, hero_attack + weapon_bonus)
+
+    turns = np.minimum(hero_survives, enemy_survives)
+    hero_alive = hero_survives > turns
+    enemy_alive = enemy_survives > turns
+
+    winners = np.where(hero_alive, HERO_WINS, np.where(enemy_alive, ENEMY_WINS, DRAW)).astype(np.int8)
+    stalemate = turns == _NEVER
+    winners[stalemate] = DRAW
+    turns[stalemate] = STALEMATE_TURNS
+    return BatchResult(winners=winners, turns=turns)
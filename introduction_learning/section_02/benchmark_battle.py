@@ -0,0 +1,90 @@
+import time
+
+import numpy as np
+
+from batch_battle import *
+from enemy import *
+from hero import *
+from weapon import *
+
+
+def scalar_battle(hero: Hero, enemy: Enemy) -> tuple[int, int]:
+    """
+    Runs the turn-by-turn loop from battle() in main.py without printing.
+
+    Args:
+        hero (Hero): The hero character, with any weapon already equipped.
+        enemy (Enemy): The enemy character.
+
+    Returns:
+        tuple[int, int]: The winner code and the number of turns played.
+    """
+    turns = 0
+    while hero.health_points > 0 and enemy.health_points > 0:
+        hero.health_points -= enemy.attack_damage
+        enemy.health_points -= hero.attack_damage
+        turns += 1
+
+    if hero.health_points > 0:
+        return HERO_WINS, turns
+    elif enemy.health_points > 0:
+        return ENEMY_WINS, turns
+    return DRAW, turns
+
+
+def run_scalar(stats: dict) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Resolves every battle in stats one at a time with Hero/Enemy objects.
+
+    Args:
+        stats (dict): Arrays keyed by the battle_batch argument names.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Winner codes and turn counts.
+    """
+    winners = np.empty(len(stats['hero_health']), dtype=np.int8)
+    turns = np.empty(len(stats['hero_health']), dtype=np.int64)
+    for i, row in enumerate(zip(*(stats[key].tolist() for key in stats))):
+        hero_health, hero_attack, weapon_bonus, enemy_health, enemy_attack = row
+        hero = Hero(hero_health, hero_attack, Weapon('Benchmark', weapon_bonus))
+        hero.equip_weapon()
+        winners[i], turns[i] = scalar_battle(hero, Enemy(enemy_health, enemy_attack))
+    return winners, turns
+
+
+def main(n_battles: int = 200_000, seed: int = 0) -> None:
+    """
+    Times the scalar loop against battle_batch on the same random battles and checks they agree.
+
+    Args:
+        n_battles (int): Number of battles to simulate.
+        seed (int): Seed for generating the battle stats.
+    """
+    rng = np.random.default_rng(seed)
+    stats = {
+        'hero_health': rng.integers(1, 100, n_battles),
+        'hero_attack': rng.integers(1, 10, n_battles),
+        'weapon_bonus': rng.integers(0, 6, n_battles),
+        'enemy_health': rng.integers(1, 100, n_battles),
+        'enemy_attack': rng.integers(1, 10, n_battles),
+    }
+
+    start = time.perf_counter()
+    scalar_winners, scalar_turns = run_scalar(stats)
+    scalar_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = battle_batch(**stats)
+    batch_seconds = time.perf_counter() - start
+
+    assert np.array_equal(scalar_winners, result.winners), 'winners differ from the scalar loop'
+    assert np.array_equal(scalar_turns, result.turns), 'turn counts differ from the scalar loop'
+
+    print(f'{n_battles:,} battles')
+    print(f'scalar loop:  {scalar_seconds:.3f}s ({n_battles / scalar_seconds:,.0f} battles/s)')
+    print(f'battle_batch: {batch_seconds:.3f}s ({n_battles / batch_seconds:,.0f} battles/s)')
+    print(f'speedup:      {scalar_seconds / batch_seconds:.0f}x')
+
+
+if __name__ == '__main__':
+    main()
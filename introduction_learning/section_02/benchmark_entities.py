@@ -0,0 +1,85 @@
+import gc
+import time
+import tracemalloc
+from random import Random
+
+from compact import *
+from events import *
+from zombie import *
+
+
+def bytes_per_entity(factory, n_entities: int) -> float:
+    """
+    Measures the average memory allocated per entity created by factory.
+
+    Args:
+        factory (Callable): Creates one entity.
+        n_entities (int): Number of entities to create for the measurement.
+
+    Returns:
+        float: Bytes allocated per entity.
+    """
+    gc.collect()
+    tracemalloc.start()
+    entities = [factory() for _ in range(n_entities)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entities
+    return allocated / n_entities
+
+
+def turns_per_second(entities: list, turns: int, seed: int = 0) -> float:
+    """
+    Plays a number of turns in which every entity uses its special ability,
+    attacks and takes one point of damage.
+
+    Args:
+        entities (list): The population to simulate.
+        turns (int): Number of turns to play.
+        seed (int): Seed for the special abilities.
+
+    Returns:
+        float: Entity turns played per second.
+    """
+    rng = Random(seed)
+    start = time.perf_counter()
+    for _ in range(turns):
+        for entity in entities:
+            entity.special_ability(rng)
+            entity.attack()
+            entity.health_points -= 1
+    return len(entities) * turns / (time.perf_counter() - start)
+
+
+def main(n_entities: int = 1_000_000, turns: int = 3) -> None:
+    """
+    Compares the dataclass Zombie with CompactZombie on memory per entity and
+    simulation throughput, with events discarded by NULL_SINK.
+
+    Args:
+        n_entities (int): Size of the simulated population.
+        turns (int): Number of turns to play.
+    """
+    variants = {
+        'Zombie': lambda: Zombie(10, 1, sink=NULL_SINK),
+        'CompactZombie': lambda: CompactZombie(10, 1, sink=NULL_SINK),
+    }
+    for name, factory in variants.items():
+        memory = bytes_per_entity(factory, n_entities)
+        entities = [factory() for _ in range(n_entities)]
+        speed = turns_per_second(entities, turns)
+        del entities
+        print(f'{name:<14} {memory:6.0f} bytes/entity  {speed:12,.0f} entity turns/s')
+
+    pool = EntityPool(lambda: CompactZombie(sink=NULL_SINK), n_entities)
+    start = time.perf_counter()
+    for _ in range(turns):
+        entities = [pool.acquire(health_points=10, attack_damage=1) for _ in range(n_entities)]
+        for entity in entities:
+            pool.release(entity)
+    seconds = time.perf_counter() - start
+    print(f'EntityPool     {n_entities * turns / seconds:,.0f} acquire/release pairs/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,240 @@
+from dataclasses import dataclass, field, fields
+from random import Random, random
+from typing import Callable, ClassVar, Generic, Optional, TypeVar
+
+from events import *
+
+# Compact counterparts of Weapon, Enemy, Zombie, Ogre and Hero for simulations with
+# very large populations. They behave like the originals but use __slots__ instead of a
+# per-instance __dict__ and keep the character type on the class rather than on every
+# instance, which cuts the memory of each entity to a few fixed-size fields.
+
+
+@dataclass(slots=True)
+class CompactWeapon:
+    """
+    Slotted variant of Weapon.
+
+    Attributes:
+        weapon_type (str): The type or name of the weapon.
+        attack_increase (int): The amount of additional attack damage this weapon provides (default is 0).
+    """
+    weapon_type: str
+    attack_increase: int = 0
+
+
+@dataclass(slots=True)
+class CompactEnemy:
+    """
+    Slotted variant of Enemy.
+
+    Attributes:
+        type_of_enemy (str): Class-level string indicating the enemy's type.
+        health_points (int): The enemy's current health.
+        attack_damage (int): The base attack damage the enemy can inflict.
+        sink (EventSink): Where the enemy reports its actions (printed to stdout by default).
+    """
+    type_of_enemy: ClassVar[str] = "unknown"
+    health_points: int = 10
+    attack_damage: int = 1
+    sink: EventSink = field(default=STDOUT_SINK, repr=False, compare=False)
+
+    def talk(self) -> None:
+        """
+        Reports a basic line introducing the enemy and warning the player.
+        """
+        self.sink.emit(self.type_of_enemy, 'talk', f'I am a {self.type_of_enemy}. Be prepared to fight.')
+
+    def walk_forward(self) -> None:
+        """
+        Reports that the enemy is moving closer to the player.
+        """
+        self.sink.emit(self.type_of_enemy, 'walk_forward', f'{self.type_of_enemy} moves closer to you.')
+
+    def attack(self) -> None:
+        """
+        Reports the enemy's attack action and the amount of damage dealt.
+        """
+        self.sink.emit(self.type_of_enemy, 'attack', f'{self.type_of_enemy} attacks for {self.attack_damage} damage.')
+
+    def special_ability(self, rng: Optional[Random] = None) -> None:
+        """
+        Reports that the enemy has no special ability.
+
+        Args:
+            rng (Optional[Random]): Unused; accepted for compatibility with subclasses.
+        """
+        self.sink.emit(self.type_of_enemy, 'special_ability', f'{self.type_of_enemy} has no special ability.')
+
+
+@dataclass(slots=True)
+class CompactZombie(CompactEnemy):
+    """
+    Slotted variant of Zombie: 50% chance to regenerate 2 HP as its special ability.
+    """
+    type_of_enemy: ClassVar[str] = "Zombie"
+
+    def talk(self) -> None:
+        """
+        Reports the Zombie's unique sound to simulate speech.
+        """
+        self.sink.emit(self.type_of_enemy, 'talk', '*Grumbling...*')
+
+    def spread_disease(self) -> None:
+        """
+        Reports the Zombie's attempt to spread infection.
+        """
+        self.sink.emit(self.type_of_enemy, 'spread_disease', f'The {self.type_of_enemy} is trying to spread an infection.')
+
+    def special_ability(self, rng: Optional[Random] = None) -> None:
+        """
+        Tries to regenerate 2 HP with a 50% chance, reporting it if it works.
+
+        Args:
+            rng (Optional[Random]): Random number generator to roll the chance with.
+        """
+        if (rng.random() if rng is not None else random()) < 0.5:
+            self.health_points += 2
+            self.sink.emit(self.type_of_enemy, 'special_ability', f'{self.type_of_enemy} regenerates 2 HP.')
+
+
+@dataclass(slots=True)
+class CompactOgre(CompactEnemy):
+    """
+    Slotted variant of Ogre: 20% chance to gain 4 HP as its special ability.
+    """
+    type_of_enemy: ClassVar[str] = "Ogre"
+
+    def talk(self) -> None:
+        """
+        Reports the Ogre's unique action to simulate speech.
+        """
+        self.sink.emit(self.type_of_enemy, 'talk', f'The {self.type_of_enemy} is slamming hands all around.')
+
+    def special_ability(self, rng: Optional[Random] = None) -> None:
+        """
+        Has a 20% chance to increase the Ogre's health points by 4, reporting it if it works.
+
+        Args:
+            rng (Optional[Random]): Random number generator to roll the chance with.
+        """
+        if (rng.random() if rng is not None else random()) < 0.2:
+            self.health_points += 4
+            self.sink.emit(self.type_of_enemy, 'special_ability', f'{self.type_of_enemy} attack has increased by 4.')
+
+
+@dataclass(slots=True)
+class CompactHero:
+    """
+    Slotted variant of Hero.
+
+    Attributes:
+        type_of_enemy (str): Class-level identifier for the character type, always "Hero"
+        health_points (int): Current health points of the hero
+        attack_damage (int): Base attack damage without weapons
+        weapon (Optional[CompactWeapon]): Currently held weapon, if any
+        is_weapon_equipped (bool): Tracks if the held weapon is equipped
+        sink (EventSink): Where the hero reports its actions (printed to stdout by default)
+    """
+    type_of_enemy: ClassVar[str] = "Hero"
+    health_points: int
+    attack_damage: int
+    weapon: Optional[CompactWeapon] = None
+    is_weapon_equipped: bool = False
+    sink: EventSink = field(default=STDOUT_SINK, repr=False, compare=False)
+
+    def equip_weapon(self) -> None:
+        """
+        Equips the currently held weapon if one exists and isn't yet equipped.
+        When equipped, the weapon's attack increase is added to the hero's attack damage.
+        """
+        if self.weapon is not None and not self.is_weapon_equipped:
+            self.attack_damage += self.weapon.attack_increase
+            self.is_weapon_equipped = True
+
+    def attack(self) -> None:
+        """
+        Reports an attack action with the total damage dealt, including any equipped weapon bonus.
+        """
+        self.sink.emit(self.type_of_enemy, 'attack', f'Hero attacks for {self.attack_damage} damage.')
+
+
+EntityT = TypeVar('EntityT')
+
+
+class EntityPool(Generic[EntityT]):
+    """
+    Recycles dataclass entity instances, keeping track of which ones are in use
+    so an entity cannot be handed out twice.
+
+    Released entities are kept on a free list and handed out again by acquire().
+    A recycled entity is reset from a newly built factory() entity, overridden by the
+    values passed to acquire(), so nothing carries over from its previous use and
+    per-entity objects such as a BufferedSink or CompactWeapon are never shared.
+    Building that fresh entity costs an allocation per acquire(), so the pool keeps
+    entity identities stable rather than saving allocations.
+    """
+
+    def __init__(self, factory: Callable[[], EntityT], size: int = 0) -> None:
+        """
+        Args:
+            factory (Callable[[], EntityT]): Creates a new entity when the free list is empty,
+                and the fresh field values a recycled entity is reset to.
+            size (int): Number of entities to create up front.
+        """
+        self._factory = factory
+        self._free: list[EntityT] = [factory() for _ in range(size)]
+        self._in_use: dict[int, EntityT] = {}
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: Number of idle entities ready to be acquired.
+        """
+        return len(self._free)
+
+    @property
+    def in_use(self) -> int:
+        """
+        Returns:
+            int: Number of entities acquired and not yet released.
+        """
+        return len(self._in_use)
+
+    def acquire(self, **values) -> EntityT:
+        """
+        Takes an entity from the pool, creating one if none are idle, and resets its fields.
+
+        Args:
+            **values: Field values to set on the entity, e.g. health_points=10.
+                Fields not given get the factory's values.
+
+        Returns:
+            EntityT: The entity, ready to use.
+        """
+        if self._free:
+            entity = self._free.pop()
+            fresh = self._factory()
+            for f in fields(fresh):
+                setattr(entity, f.name, getattr(fresh, f.name))
+        else:
+            entity = self._factory()
+        for name, value in values.items():
+            setattr(entity, name, value)
+        self._in_use[id(entity)] = entity
+        return entity
+
+    def release(self, entity: EntityT) -> None:
+        """
+        Returns an entity to the pool. The caller must not use it afterwards.
+
+        Args:
+            entity (EntityT): An entity previously returned by acquire().
+
+        Raises:
+            ValueError: If the entity is not currently acquired from this pool,
+                e.g. because it was already released.
+        """
+        if self._in_use.pop(id(entity), None) is not entity:
+            raise ValueError("Entity is not in use from this pool; it may have been released already.")
+        self._free.append(entity)
@@ -1,4 +1,8 @@
 from dataclasses import dataclass, asdict, field
+from random import Random
+from typing import Optional
+
+from events import *
 
 @dataclass
 class Enemy:
@@ -9,10 +13,12 @@ class Enemy:
         _type_of_enemy (str): Internal string indicating the enemy's type.
         health_points (int): The enemy's current health.
         attack_damage (int): The base attack damage the enemy can inflict.
+        sink (EventSink): Where the enemy reports its actions (printed to stdout by default).
     """
     _type_of_enemy: str = field(init=False, default="unknown")
     health_points: int = 10
     attack_damage: int = 1
+    sink: EventSink = field(default=STDOUT_SINK, repr=False, compare=False)
 
     def __post_init__(self):
         """
@@ -34,25 +40,29 @@ class Enemy:
 
     def talk(self) -> None:
         """
-        Prints a basic line introducing the enemy and warning the player.
+        Reports a basic line introducing the enemy and warning the player.
         """
-        print(f'I am a {self.type_of_enemy}. Be prepared to fight.')
+        self.sink.emit(self.type_of_enemy, 'talk', f'I am a {self.type_of_enemy}. Be prepared to fight.')
 
     def walk_forward(self) -> None:
         """
-        Prints a message indicating the enemy is moving closer to the player.
+        Reports a message indicating the enemy is moving closer to the player.
         """
-        print(f'{self.type_of_enemy} moves closer to you.')
+        self.sink.emit(self.type_of_enemy, 'walk_forward', f'{self.type_of_enemy} moves closer to you.')
 
     def attack(self) -> None:
         """
-        Prints the enemy's attack action and the amount of damage dealt.
+        Reports the enemy's attack action and the amount of damage dealt.
         """
-        print(f'{self.type_of_enemy} attacks for {self.attack_damage} damage.')
+        self.sink.emit(self.type_of_enemy, 'attack', f'{self.type_of_enemy} attacks for {self.attack_damage} damage.')
 
-    def special_ability(self) -> None:
+    def special_ability(self, rng: Optional[Random] = None) -> None:
         """
-        Prints a message indicating that the enemy has no special ability.
+        Reports a message indicating that the enemy has no special ability.
         Intended to be overridden by subclasses that have special abilities.
+
+        Args:
+            rng (Optional[Random]): Random number generator for abilities that depend on chance.
+                Falls back to the global generator when not given.
         """
-        print(f'{self.type_of_enemy} has no special ability.')
\ No newline at end of file
+        self.sink.emit(self.type_of_enemy, 'special_ability', f'{self.type_of_enemy} has no special ability.')
\ No newline at end of file
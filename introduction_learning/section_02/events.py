@@ -0,0 +1,88 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    """
+    A single structured entry in the game's event log.
+
+    Attributes:
+        actor (str): Type of the character performing the action, e.g. "Zombie".
+        action (str): Name of the action, e.g. "attack" or "special_ability".
+        message (str): Human-readable description of what happened.
+    """
+    actor: str
+    action: str
+    message: str
+
+
+class EventSink(ABC):
+    """
+    Base class for destinations of game events.
+
+    Characters report their actions through a sink instead of printing directly,
+    so the same code can run noisily in the terminal or silently in large simulations.
+    """
+
+    @abstractmethod
+    def emit(self, actor: str, action: str, message: str) -> None:
+        """
+        Records an event.
+
+        Args:
+            actor (str): Type of the character performing the action.
+            action (str): Name of the action.
+            message (str): Human-readable description of what happened.
+        """
+
+
+class NullSink(EventSink):
+    """
+    Discards every event. Use for simulations where output is not needed.
+    """
+
+    def emit(self, actor: str, action: str, message: str) -> None:
+        """
+        Ignores the event.
+        """
+
+
+class StdoutSink(EventSink):
+    """
+    Prints each event's message, matching the game's original console output.
+    """
+
+    def emit(self, actor: str, action: str, message: str) -> None:
+        """
+        Prints the event's message; actor and action are not shown.
+        """
+        print(message)
+
+
+@dataclass
+class BufferedSink(EventSink):
+    """
+    Collects events in memory as a structured log.
+
+    Attributes:
+        events (list[Event]): Events recorded so far, oldest first.
+    """
+    events: list[Event] = field(default_factory=list)
+
+    def emit(self, actor: str, action: str, message: str) -> None:
+        """
+        Appends the event to the log.
+        """
+        self.events.append(Event(actor, action, message))
+
+    def clear(self) -> None:
+        """
+        Removes all recorded events.
+        """
+        self.events.clear()
+
+
+# Shared sink instances; sinks hold no per-character state, so one of each is enough.
+STDOUT_SINK = StdoutSink()
+NULL_SINK = NullSink()
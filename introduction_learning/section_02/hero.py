@@ -1,4 +1,5 @@
 from weapon import *
+from events import *
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -15,12 +16,14 @@ class Hero:
         attack_damage (int): Base attack damage without weapons
         weapon (Optional[Weapon]): Currently held weapon, if any
         is_weapon_equipped (bool): Tracks if the held weapon is equipped
+        sink (EventSink): Where the hero reports its actions (printed to stdout by default)
     """
     _type_of_enemy: str = field(init=False, default="Hero")
     health_points: int
     attack_damage: int
     weapon: Optional[Weapon] = None
     is_weapon_equipped: bool = False
+    sink: EventSink = field(default=STDOUT_SINK, repr=False, compare=False)
 
     @property
     def type_of_enemy(self) -> str:
@@ -43,7 +46,7 @@ class Hero:
 
     def attack(self) -> None:
         """
-        Performs an attack action, displaying the total damage dealt.
+        Performs an attack action, reporting the total damage dealt.
         The damage includes both base attack damage and any equipped weapon bonus.
         """
-        print(f'Hero attacks for {self.attack_damage} damage.')
\ No newline at end of file
+        self.sink.emit(self.type_of_enemy, 'attack', f'Hero attacks for {self.attack_damage} damage.')
\ No newline at end of file
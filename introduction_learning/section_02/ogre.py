@@ -1,5 +1,6 @@
 from enemy import *
-from random import random
+from random import Random, random
+from typing import Optional
 
 class Ogre(Enemy):
     """
@@ -15,22 +16,26 @@ class Ogre(Enemy):
         """
         Post-initialization to set the specific enemy type for Ogre.
         """
-        self._type_of_enemy = "Hero"
+        self._type_of_enemy = "Ogre"
         super().__post_init__()
 
     def talk(self):
         """
-        Prints the Ogre's unique action to simulate speech.
+        Reports the Ogre's unique action to simulate speech.
         """
-        print(f'The {self.type_of_enemy} is slamming hands all around.')
+        self.sink.emit(self.type_of_enemy, 'talk', f'The {self.type_of_enemy} is slamming hands all around.')
 
-    def special_ability(self):
+    def special_ability(self, rng: Optional[Random] = None):
         """
         Has a 20% chance to increase the Ogre's health points by 4.
 
-        If the ability is successful, prints a notification message.
+        If the ability is successful, reports a notification message.
+
+        Args:
+            rng (Optional[Random]): Random number generator to roll the chance with.
+                Uses the global generator when not given.
         """
-        did_special_ability_work = random() < 0.2
+        did_special_ability_work = (rng.random() if rng is not None else random()) < 0.2
         if did_special_ability_work:
             self.health_points += 4
-            print(f'{self.type_of_enemy} attack has increased by 4.')
\ No newline at end of file
+            self.sink.emit(self.type_of_enemy, 'special_ability', f'{self.type_of_enemy} attack has increased by 4.')
\ No newline at end of file
@@ -0,0 +1,4 @@
+# Winner codes shared by every battle engine (battle_batch, duel and run_tournament).
+HERO_WINS = 1
+ENEMY_WINS = -1
+DRAW = 0
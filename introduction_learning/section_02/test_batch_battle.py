@@ -0,0 +1,52 @@
+from itertools import product
+
+import numpy as np
+
+from batch_battle import *
+
+
+def reference_battle(hero_health, hero_attack, weapon_bonus, enemy_health, enemy_attack, max_turns=100):
+    """
+    Turn-by-turn version of battle() in main.py, returning (winner, turns).
+    Battles still running after max_turns are reported as stalemates.
+    """
+    hero_attack += weapon_bonus
+    turns = 0
+    while hero_health > 0 and enemy_health > 0:
+        if turns == max_turns:
+            return DRAW, STALEMATE_TURNS
+        hero_health -= enemy_attack
+        enemy_health -= hero_attack
+        turns += 1
+
+    if hero_health > 0:
+        return HERO_WINS, turns
+    elif enemy_health > 0:
+        return ENEMY_WINS, turns
+    return DRAW, turns
+
+
+def test_matches_turn_by_turn_reference():
+    battles = list(product(range(-2, 7), range(-1, 4), range(-1, 3), range(-2, 7), range(-1, 4)))
+    result = battle_batch(*np.array(battles).T)
+
+    expected = [reference_battle(*battle) for battle in battles]
+    assert result.winners.tolist() == [winner for winner, _ in expected]
+    assert result.turns.tolist() == [turns for _, turns in expected]
+
+
+def test_covers_draws_and_stalemates():
+    result = battle_batch([10, 5, 0], [1, 0, 1], 0, [10, 5, 0], [1, 0, 1])
+
+    assert result.winners.tolist() == [DRAW, DRAW, DRAW]
+    assert result.turns.tolist() == [10, STALEMATE_TURNS, 0]
+
+
+def test_scalars_broadcast_against_arrays():
+    single = battle_batch(10, 1, 5, 10, 1)
+    assert single.winners.tolist() == [HERO_WINS]
+    assert single.turns.tolist() == [2]
+
+    result = battle_batch(10, 1, 0, [5, 20], 1)
+    assert result.winners.tolist() == [HERO_WINS, ENEMY_WINS]
+    assert result.turns.tolist() == [5, 10]
@@ -0,0 +1,61 @@
+import pytest
+
+from compact import *
+from ogre import *
+
+
+def test_acquire_resets_fields_from_previous_use():
+    pool = EntityPool(lambda: CompactHero(0, 0, sink=NULL_SINK))
+    hero = pool.acquire(health_points=10, attack_damage=1, weapon=CompactWeapon('Sword', 5))
+    hero.equip_weapon()
+    pool.release(hero)
+
+    recycled = pool.acquire(health_points=10, attack_damage=1, weapon=CompactWeapon('Sword', 5))
+    recycled.equip_weapon()
+
+    assert recycled is hero
+    assert recycled.attack_damage == 6
+    assert recycled.sink is NULL_SINK
+
+
+def test_recycled_entities_do_not_share_mutable_fields():
+    pool = EntityPool(lambda: CompactZombie(sink=BufferedSink()), 2)
+    zombies = [pool.acquire() for _ in range(3)]
+    pool.release(zombies[0])
+    recycled = pool.acquire()
+
+    recycled.talk()
+
+    assert recycled is zombies[0]
+    sinks = [zombie.sink for zombie in zombies[1:] + [recycled]]
+    assert len({id(sink) for sink in sinks}) == 3
+    assert [len(sink.events) for sink in sinks] == [0, 0, 1]
+
+
+def test_recycled_heroes_get_their_own_weapon():
+    pool = EntityPool(lambda: CompactHero(10, 1, CompactWeapon('Sword', 5), sink=NULL_SINK))
+    first = pool.acquire()
+    pool.release(first)
+    recycled = pool.acquire()
+    other = pool.acquire()
+
+    assert recycled.weapon is not other.weapon
+
+
+def test_double_release_is_rejected():
+    pool = EntityPool(CompactZombie)
+    zombie = pool.acquire()
+    pool.release(zombie)
+
+    with pytest.raises(ValueError):
+        pool.release(zombie)
+    assert pool.in_use == 0
+    assert len(pool) == 1
+
+
+def test_compact_ogre_logs_same_actor_as_ogre():
+    log = BufferedSink()
+    Ogre(sink=log).talk()
+    CompactOgre(sink=log).talk()
+
+    assert log.events[0] == log.events[1]
@@ -0,0 +1,19 @@
+from tournament import *
+
+
+HEROES = [Hero(10, 1), Hero(10, 1, Weapon('Dagger', 1))]
+
+
+def test_results_do_not_depend_on_worker_count():
+    one_worker = run_tournament(HEROES, 500, seed=7, chunk_size=64, max_workers=1)
+    two_workers = run_tournament(HEROES, 500, seed=7, chunk_size=64, max_workers=2)
+
+    assert one_worker.matchups == two_workers.matchups
+    assert all(stats.trials == 500 for stats in one_worker.matchups.values())
+
+
+def test_different_seeds_give_different_results():
+    first = run_tournament(HEROES, 500, seed=7, chunk_size=64, max_workers=1)
+    second = run_tournament(HEROES, 500, seed=8, chunk_size=64, max_workers=1)
+
+    assert first.matchups != second.matchups
@@ -0,0 +1,244 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from random import Random
+from typing import Optional
+
+from outcomes import *
+from zombie import *
+from ogre import *
+from hero import *
+from weapon import *
+
+
+@dataclass
+class MatchupStats:
+    """
+    Aggregated results of one hero configuration fighting one enemy type.
+
+    Attributes:
+        trials (int): Number of battles played.
+        hero_wins (int): Battles won by the hero.
+        enemy_wins (int): Battles won by the enemy.
+        draws (int): Battles where both sides fell on the same turn or max_turns was reached.
+        total_turns (int): Sum of turns over all battles.
+        min_turns (Optional[int]): Shortest battle, if any were played.
+        max_turns (Optional[int]): Longest battle, if any were played.
+    """
+    trials: int = 0
+    hero_wins: int = 0
+    enemy_wins: int = 0
+    draws: int = 0
+    total_turns: int = 0
+    min_turns: Optional[int] = None
+    max_turns: Optional[int] = None
+
+    @property
+    def win_rate(self) -> float:
+        """
+        Returns:
+            float: Fraction of battles won by the hero.
+        """
+        return self.hero_wins / self.trials if self.trials else 0.0
+
+    @property
+    def mean_turns(self) -> float:
+        """
+        Returns:
+            float: Average number of turns per battle.
+        """
+        return self.total_turns / self.trials if self.trials else 0.0
+
+    def record(self, winner: int, turns: int) -> None:
+        """
+        Adds the outcome of a single battle.
+
+        Args:
+            winner (int): HERO_WINS, ENEMY_WINS or DRAW.
+            turns (int): Number of turns the battle lasted.
+        """
+        self.trials += 1
+        if winner == HERO_WINS:
+            self.hero_wins += 1
+        elif winner == ENEMY_WINS:
+            self.enemy_wins += 1
+        else:
+            self.draws += 1
+        self.total_turns += turns
+        self.min_turns = turns if self.min_turns is None else min(self.min_turns, turns)
+        self.max_turns = turns if self.max_turns is None else max(self.max_turns, turns)
+
+    def merge(self, other: "MatchupStats") -> None:
+        """
+        Folds another set of results for the same matchup into this one.
+
+        Args:
+            other (MatchupStats): Results computed by another worker.
+        """
+        self.trials += other.trials
+        self.hero_wins += other.hero_wins
+        self.enemy_wins += other.enemy_wins
+        self.draws += other.draws
+        self.total_turns += other.total_turns
+        for name, pick in (('min_turns', min), ('max_turns', max)):
+            mine, theirs = getattr(self, name), getattr(other, name)
+            if theirs is not None:
+                setattr(self, name, theirs if mine is None else pick(mine, theirs))
+
+
+@dataclass
+class TournamentResult:
+    """
+    Results of a tournament, keyed by (hero index, enemy type name).
+
+    Attributes:
+        heroes (list[Hero]): The hero configurations that took part, in input order.
+        matchups (dict[tuple[int, str], MatchupStats]): Merged statistics for each matchup.
+    """
+    heroes: list[Hero]
+    matchups: dict[tuple[int, str], MatchupStats] = field(default_factory=dict)
+
+
+def duel(hero: Hero, enemy: Enemy, rng: Random, max_turns: int = 1000) -> tuple[int, int]:
+    """
+    Plays one battle following the rules of battle() in main.py, with the enemy
+    using its special ability at the start of every turn.
+
+    Args:
+        hero (Hero): The hero character, with any weapon already equipped.
+        enemy (Enemy): The enemy character.
+        rng (Random): Random number generator passed to the enemy's special ability.
+        max_turns (int): Turn limit after which the battle is declared a draw.
+
+    Returns:
+        tuple[int, int]: The winner code and the number of turns played.
+    """
+    turns = 0
+    while hero.health_points > 0 and enemy.health_points > 0 and turns < max_turns:
+        enemy.special_ability(rng)
+        hero.health_points -= enemy.attack_damage
+        enemy.health_points -= hero.attack_damage
+        turns += 1
+
+    if hero.health_points > 0 and enemy.health_points <= 0:
+        return HERO_WINS, turns
+    elif enemy.health_points > 0 and hero.health_points <= 0:
+        return ENEMY_WINS, turns
+    return DRAW, turns
+
+
+def _run_chunk(hero: Hero, enemy: Enemy, trials: int, stream_seed: str, max_turns: int) -> MatchupStats:
+    """
+    Worker entry point: plays a block of trials for one matchup on its own RNG stream.
+
+    Args:
+        hero (Hero): Template hero; copied for every trial.
+        enemy (Enemy): Template enemy; copied for every trial.
+        trials (int): Number of battles to play.
+        stream_seed (str): Seed identifying this block's RNG stream.
+        max_turns (int): Turn limit passed to duel().
+
+    Returns:
+        MatchupStats: Statistics for this block.
+    """
+    rng = Random(stream_seed)
+    stats = MatchupStats()
+    for _ in range(trials):
+        fighter = replace(hero)
+        fighter.equip_weapon()
+        stats.record(*duel(fighter, replace(enemy), rng, max_turns))
+    return stats
+
+
+def run_tournament(
+    heroes: list[Hero],
+    trials: int,
+    seed: int = 0,
+    enemy_types: Optional[list[type[Enemy]]] = None,
+    enemy_health: int = 10,
+    enemy_attack: int = 1,
+    chunk_size: int = 1000,
+    max_turns: int = 1000,
+    max_workers: Optional[int] = None,
+) -> TournamentResult:
+    """
+    Pits every hero configuration against every enemy type over many trials on a process pool.
+
+    Trials are split into fixed-size chunks and every chunk draws from its own RNG stream,
+    derived from the seed, the matchup and the chunk index. Results therefore depend only
+    on the arguments, not on the number of workers or the order chunks finish in.
+
+    Args:
+        heroes (list[Hero]): Hero configurations, each with an optional Weapon to equip.
+        trials (int): Number of battles per matchup.
+        seed (int): Base seed for all RNG streams.
+        enemy_types (Optional[list[type[Enemy]]]): Enemy classes to fight. Defaults to [Zombie, Ogre].
+        enemy_health (int): Starting health_points of each enemy.
+        enemy_attack (int): attack_damage of each enemy.
+        chunk_size (int): Trials per task sent to a worker.
+        max_turns (int): Turn limit after which a battle is declared a draw.
+        max_workers (Optional[int]): Number of worker processes. Defaults to the CPU count.
+
+    Returns:
+        TournamentResult: Merged statistics for every matchup.
+    """
+    if enemy_types is None:
+        enemy_types = [Zombie, Ogre]
+    result = TournamentResult(heroes=list(heroes))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = []
+        for hero_index, hero in enumerate(heroes):
+            for enemy_type in enemy_types:
+                key = (hero_index, enemy_type.__name__)
+                result.matchups[key] = MatchupStats()
+                # Keep millions of special ability messages off the console.
+                enemy = enemy_type(enemy_health, enemy_attack, sink=NULL_SINK)
+                for chunk_index, start in enumerate(range(0, trials, chunk_size)):
+                    stream_seed = f'{seed}:{hero_index}:{enemy_type.__name__}:{chunk_index}'
+                    chunk_trials = min(chunk_size, trials - start)
+                    futures.append((key, pool.submit(_run_chunk, hero, enemy, chunk_trials, stream_seed, max_turns)))
+
+        for key, future in futures:
+            result.matchups[key].merge(future.result())
+
+    return result
+
+
+def main(trials: int = 20_000, seed: int = 0) -> None:
+    """
+    Runs a sample tournament on one worker and on every core, checks the results match,
+    and prints the win-rate table with the speedup.
+
+    Args:
+        trials (int): Number of battles per matchup.
+        seed (int): Base seed for all RNG streams.
+    """
+    heroes = [
+        Hero(10, 1),
+        Hero(10, 1, Weapon('Dagger', 1)),
+        Hero(10, 1, Weapon('Sword', 5)),
+    ]
+    timings = {}
+    results = {}
+    for workers in sorted({1, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        results[workers] = run_tournament(heroes, trials, seed=seed, max_workers=workers)
+        timings[workers] = time.perf_counter() - start
+
+    baseline = results[1]
+    assert all(result.matchups == baseline.matchups for result in results.values()), \
+        'results differ between worker counts'
+
+    for (hero_index, enemy_name), stats in baseline.matchups.items():
+        weapon = heroes[hero_index].weapon
+        label = weapon.weapon_type if weapon else 'No weapon'
+        print(f'{label:<10} vs {enemy_name:<8} win rate {stats.win_rate:6.1%}  '
+              f'mean turns {stats.mean_turns:5.2f}  draws {stats.draws}')
+    for workers, seconds in timings.items():
+        print(f'{workers} worker(s): {seconds:.2f}s (speedup {timings[1] / seconds:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
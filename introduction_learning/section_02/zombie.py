@@ -1,4 +1,5 @@
-from random import random
+from random import Random, random
+from typing import Optional
 from enemy import *
 
 class Zombie(Enemy):
@@ -20,23 +21,27 @@ class Zombie(Enemy):
 
     def talk(self):
         """
-        Prints the Zombie's unique sound to simulate speech.
+        Reports the Zombie's unique sound to simulate speech.
         """
-        print(f'*Grumbling...*')
+        self.sink.emit(self.type_of_enemy, 'talk', f'*Grumbling...*')
 
     def spread_disease(self):
         """
-        Prints a message describing the Zombie's attempt to spread infection.
+        Reports a message describing the Zombie's attempt to spread infection.
         """
-        print(f'The {self.type_of_enemy} is trying to spread an infection.')
+        self.sink.emit(self.type_of_enemy, 'spread_disease', f'The {self.type_of_enemy} is trying to spread an infection.')
 
-    def special_ability(self):
+    def special_ability(self, rng: Optional[Random] = None):
         """
         Tries to regenerate the Zombie's health by 2 points with a 50% chance.
 
-        If regeneration occurs, prints a regeneration message.
+        If regeneration occurs, reports a regeneration message.
+
+        Args:
+            rng (Optional[Random]): Random number generator to roll the chance with.
+                Uses the global generator when not given.
         """
-        did_special_ability_work = random() < 0.5
+        did_special_ability_work = (rng.random() if rng is not None else random()) < 0.5
         if did_special_ability_work:
             self.health_points += 2
-            print(f'{self.type_of_enemy} regenerates 2 HP.')
\ No newline at end of file
+            self.sink.emit(self.type_of_enemy, 'special_ability', f'{self.type_of_enemy} regenerates 2 HP.')
\ No newline at end of file
@@ -4,15 +4,139 @@ Database setup for FastAPI app using SQLAlchemy and SQLite.
 - Configures the database engine and session factory.
 - Provides a Base class for SQLAlchemy ORM models.
 - Defines a FastAPI-compatible dependency function for creating and closing DB sessions.
+- Provides a lazy session dependency that only opens a session on first use.
+- Records connection pool checkouts, wait times and hold times per route.
 
 Usage:
     - Import `Base` to define SQLAlchemy models.
-    - Use `get_db` as a dependency in FastAPI routes to access the database session.
+    - Use `get_db` or `get_lazy_db` as a dependency in FastAPI routes to access the database session.
+    - Read `pool_stats.snapshot()` to see how each route uses the connection pool.
 """
 
-from sqlalchemy import create_engine
+from contextvars import ContextVar
+from threading import Lock
+from time import perf_counter
+
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+# Label for pool usage outside a request handled through `get_lazy_db`,
+# e.g. `create_all` at startup or sessions from `get_db`.
+NO_ROUTE = "(no route)"
+
+# Route currently using the database, set by `get_lazy_db` and read by the pool events.
+current_route: ContextVar[str] = ContextVar("current_route", default=NO_ROUTE)
+
+
+class PoolStats:
+    """
+    Thread-safe counters of connection pool usage, grouped by route.
+
+    For every route it tracks how many connections were checked out, how many times and
+    how long callers waited for the pool to hand one over (including opening new
+    connections and waits that timed out), how many waits timed out, and how long
+    connections were held before being checked back in.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._routes: dict[str, dict[str, float]] = {}
+
+    def _route(self, route: str) -> dict[str, float]:
+        return self._routes.setdefault(route, {
+            "checkouts": 0, "waits": 0, "timeouts": 0,
+            "total_wait_ms": 0.0, "max_wait_ms": 0.0,
+            "total_hold_ms": 0.0, "max_hold_ms": 0.0,
+        })
+
+    def record_wait(self, route: str, wait_seconds: float, timed_out: bool = False) -> None:
+        """
+        Adds the time one caller spent waiting on the pool.
+
+        Args:
+            route (str): The route that asked for a connection, e.g. "GET /{todo_id}".
+            wait_seconds (float): Time until a connection was handed over or the wait failed.
+            timed_out (bool): Whether the pool gave up before a connection was available.
+        """
+        with self._lock:
+            stats = self._route(route)
+            stats["waits"] += 1
+            stats["timeouts"] += timed_out
+            stats["total_wait_ms"] += wait_seconds * 1000
+            stats["max_wait_ms"] = max(stats["max_wait_ms"], wait_seconds * 1000)
+
+    def record_checkout(self, route: str) -> None:
+        """
+        Adds one connection checkout for a route.
+
+        Args:
+            route (str): The route that checked out the connection.
+        """
+        with self._lock:
+            self._route(route)["checkouts"] += 1
+
+    def record_checkin(self, route: str, hold_seconds: float) -> None:
+        """
+        Adds the time a connection was held before being returned to the pool.
+
+        Args:
+            route (str): The route that checked out the connection.
+            hold_seconds (float): Time between checkout and checkin.
+        """
+        with self._lock:
+            stats = self._route(route)
+            stats["total_hold_ms"] += hold_seconds * 1000
+            stats["max_hold_ms"] = max(stats["max_hold_ms"], hold_seconds * 1000)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """
+        Returns:
+            dict: The counters for each route, plus mean wait and hold in milliseconds.
+        """
+        with self._lock:
+            return {
+                route: {
+                    **stats,
+                    "mean_wait_ms": stats["total_wait_ms"] / stats["waits"] if stats["waits"] else 0.0,
+                    "mean_hold_ms": stats["total_hold_ms"] / stats["checkouts"] if stats["checkouts"] else 0.0,
+                }
+                for route, stats in self._routes.items()
+            }
+
+    def reset(self) -> None:
+        """
+        Clears all recorded usage.
+        """
+        with self._lock:
+            self._routes.clear()
+
+
+# Process-wide pool statistics, filled in by the pool below.
+pool_stats = PoolStats()
+
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool that records how long each caller waits for a connection.
+    """
+
+    def connect(self):
+        """
+        Checks out a connection, recording the wait under the current route.
+        """
+        started = perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            pool_stats.record_wait(current_route.get(), perf_counter() - started, timed_out=True)
+            raise
+        pool_stats.record_wait(current_route.get(), perf_counter() - started)
+        return connection
+
 
 # Database URL for SQLite (local file named .todos.db)
 SQLALCHEMY_DATABASE_URL = 'sqlite:///.todos.db'
@@ -21,7 +145,8 @@ SQLALCHEMY_DATABASE_URL = 'sqlite:///.todos.db'
 # For SQLite, 'check_same_thread=False' allows usage in multithreaded FastAPI apps.
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}
+    connect_args={"check_same_thread": False},
+    poolclass=TimedQueuePool
 )
 
 # Create a configured "Session" class (for database sessions/transactions).
@@ -44,4 +169,88 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+@event.listens_for(engine, "checkout")
+def _record_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    """
+    Counts a checkout and remembers which route holds the connection and since when.
+    """
+    route = current_route.get()
+    connection_record.info["route"] = route
+    connection_record.info["checked_out_at"] = perf_counter()
+    pool_stats.record_checkout(route)
+
+
+@event.listens_for(engine, "checkin")
+def _record_checkin(dbapi_connection, connection_record) -> None:
+    """
+    Records how long the route that checked out the connection held it.
+    """
+    checked_out_at = connection_record.info.pop("checked_out_at", None)
+    if checked_out_at is not None:
+        pool_stats.record_checkin(connection_record.info.pop("route", NO_ROUTE), perf_counter() - checked_out_at)
+
+
+class LazySession:
+    """
+    Partial proxy for a SQLAlchemy Session that is only created on first use.
+
+    Attribute access (e.g. `db.query`) creates the real session, so requests that
+    never touch the database, such as ones rejected by validation, never open one
+    or check out a pooled connection. It also works as a context manager.
+
+    It is not a Session subclass: `isinstance(db, Session)` is False, and special
+    methods other than `__enter__`/`__exit__` are not forwarded.
+    """
+
+    def __init__(self):
+        self._session: Session | None = None
+
+    def __getattr__(self, name: str):
+        if self._session is None:
+            self._session = SessionLocal()
+        return getattr(self._session, name)
+
+    def __enter__(self) -> "LazySession":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the real session if one was created.
+        """
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+async def get_lazy_db(request: Request):
+    """
+    Dependency generator that provides a lazily created SQLAlchemy database session.
+
+    Unlike `get_db`, no session is created until the route first uses it, and pool
+    usage is recorded under the route's method and path template. It is async so the
+    route label it sets is visible to the route handler.
+
+    Args:
+        request (Request): The incoming request, used to find the matched route.
+
+    Yields:
+        LazySession: A proxy that behaves like a Session once used.
+
+    Ensures:
+        The session, if one was created, is closed after use, regardless of request outcome.
+    """
+    route = request.scope.get("route")
+    path = route.path if route is not None else request.url.path
+    token = current_route.set(f"{request.method} {path}")
+    db = LazySession()
+    try:
+        yield db
+    finally:
+        db.close()
+        current_route.reset(token)
@@ -5,14 +5,13 @@ Main FastAPI application for Todo API.
 - Provides a route to read all todo items from the database.
 - Integrates SQLAlchemy ORM for data access.
 - Uses Pydantic models for response validation.
+- Exposes connection pool statistics per route for sizing the pool.
 """
 from http.client import HTTPException
 from typing import Annotated, List
 
 from fastapi import FastAPI, Depends, HTTPException, status, Path
-from sqlalchemy.orm import Session
-
-from database import engine, get_db
+from database import engine, get_lazy_db, pool_stats, LazySession
 import models
 from models import Todo
 from schemas import TodoResponse
@@ -22,8 +21,9 @@ app = FastAPI()
 # Create all database tables on startup (no-op if tables already exist).
 models.Base.metadata.create_all(bind=engine)
 
-# Create shorthand for api argument database dependency
-db_dependency = Annotated[Session, Depends(get_db)]
+# Create shorthand for api argument database dependency.
+# The session is created lazily, so requests that fail validation never check out a connection.
+db_dependency = Annotated[LazySession, Depends(get_lazy_db)]
 
 
 @app.get("/", response_model=List[TodoResponse], status_code=status.HTTP_200_OK)
@@ -34,20 +34,31 @@ async def read_all(db: db_dependency):
     Returns a list of all todo items stored in the database, serialized using the Pydantic response model.
 
     Args:
-        db (Session): SQLAlchemy database session provided by dependency injection.
+        db (LazySession): Lazily created SQLAlchemy database session provided by dependency injection.
 
     Returns:
         List[TodoResponse]: A list of all todo items in the database.
     """
     return db.query(Todo).all()
 
+@app.get("/metrics/pool", status_code=status.HTTP_200_OK, include_in_schema=False)
+async def read_pool_metrics():
+    """
+    Report connection pool usage.
+
+    Returns:
+        dict: The pool's current status and, for each route, the number of connection
+        checkouts and timeouts with their total, mean and maximum wait and hold times in milliseconds.
+    """
+    return {"pool": engine.pool.status(), "routes": pool_stats.snapshot()}
+
 @app.get("/{todo_id}", response_model=TodoResponse, status_code=status.HTTP_200_OK)
 async def read_todo(db: db_dependency, todo_id: int = Path(gt=0)):
     """
     Retrieve a single todo item by its unique positive integer ID.
 
     Args:
-        db (Session): SQLAlchemy database session provided by dependency injection.
+        db (LazySession): Lazily created SQLAlchemy database session provided by dependency injection.
         todo_id (int): The unique ID of the todo item. Must be greater than 0.
 
     Returns:
@@ -0,0 +1,83 @@
+import importlib
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="module")
+def todo_app(tmp_path_factory):
+    """
+    Imports the app with the working directory set to a temporary folder, so the
+    relative SQLite URL opens a throwaway .todos.db instead of the developer's.
+    """
+    previous_cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("todo_app"))
+    try:
+        database = importlib.import_module("database")
+        main = importlib.import_module("main")
+        yield database, TestClient(main.app)
+        database.engine.dispose()
+    finally:
+        os.chdir(previous_cwd)
+
+
+@pytest.fixture
+def database(todo_app):
+    return todo_app[0]
+
+
+@pytest.fixture
+def client(todo_app):
+    return todo_app[1]
+
+
+@pytest.fixture(autouse=True)
+def count_sessions(database, monkeypatch):
+    """
+    Starts each test with empty pool statistics and counts the sessions it creates.
+    """
+    database.pool_stats.reset()
+    created = []
+    session_local_factory = database.SessionLocal
+
+    def session_local():
+        created.append(True)
+        return session_local_factory()
+
+    monkeypatch.setattr(database, "SessionLocal", session_local)
+    return created
+
+
+def test_invalid_todo_id_creates_no_session(client, database, count_sessions):
+    response = client.get("/0")
+
+    assert response.status_code == 422
+    assert count_sessions == []
+    assert database.pool_stats.snapshot() == {}
+
+
+def test_checkouts_are_labelled_with_route_template(client, database, count_sessions):
+    client.get("/1")
+    client.get("/2")
+    client.get("/")
+
+    stats = database.pool_stats.snapshot()
+    assert len(count_sessions) == 3
+    assert set(stats) == {"GET /{todo_id}", "GET /"}
+    assert stats["GET /{todo_id}"]["checkouts"] == 2
+    assert stats["GET /{todo_id}"]["waits"] == 2
+    assert stats["GET /"]["checkouts"] == 1
+    assert stats["GET /"]["total_hold_ms"] > 0
+
+
+def test_lazy_session_works_as_context_manager(database, count_sessions):
+    from models import Todo
+
+    with database.LazySession() as db:
+        assert count_sessions == []
+        assert db.query(Todo).all() == []
+        assert database.engine.pool.checkedout() == 1
+
+    assert len(count_sessions) == 1
+    assert database.engine.pool.checkedout() == 0